@@ -13,9 +13,27 @@ Date: October 2025
 import pandas as pd
 import numpy as np
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import logging
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Optional
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Arrow-backed strings live in contiguous buffers and dispatch .str operations
+# to Arrow compute kernels instead of looping over Python str objects
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+# Google Forms emits one fixed timestamp format; parsing with an explicit
+# format skips per-row heuristic date inference in every engine
+TIMESTAMP_FORMAT = '%m/%d/%Y %H:%M:%S'
 
 # Configure logging
 logging.basicConfig(
@@ -62,195 +80,424 @@ class StudentDataCleaner:
             'A': 4.5, 'B': 3.5, 'C': 3.0, 'D': 2.5, 'F': 1.5
         }
     
-    def _clean_timestamps(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Clean and validate timestamp data."""
-        logger.info("Processing timestamps...")
-        original_count = len(df)
-        
-        df['Timestamp'] = pd.to_datetime(df['Timestamp'], errors='coerce')
-        df.dropna(subset=['Timestamp'], inplace=True)
-        
-        removed_count = original_count - len(df)
-        logger.info(f"Timestamp cleaning: {removed_count} invalid records removed")
-        return df
-    
-    def _clean_student_ids(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize student ID format."""
-        logger.info("Standardizing student IDs...")
-        
-        df.rename(columns={'Student ID': 'Student_ID'}, inplace=True)
-        df['Student_ID'] = df['Student_ID'].str.lower().str.strip()
-        
-        logger.info(f"Student IDs processed: {df['Student_ID'].nunique()} unique IDs")
-        return df
-    
-    def _clean_ages(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Validate and clean age data."""
-        logger.info("Processing age data...")
-        original_count = len(df)
-        
-        df['Age'] = pd.to_numeric(df['Age'], errors='coerce')
-        df.dropna(subset=['Age'], inplace=True)
-        df = df[(df['Age'] >= 18) & (df['Age'] <= 60)]
-        df['Age'] = df['Age'].astype(int)
-        
-        removed_count = original_count - len(df)
-        logger.info(f"Age validation: {removed_count} records removed (invalid/out-of-range)")
-        return df
-    
-    def _clean_gender(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize gender categories."""
-        logger.info("Standardizing gender data...")
-        
-        df['Gender'] = df['Gender'].replace(self.gender_mapping)
-        df['Gender'] = df['Gender'].fillna('Other').str.title().astype('string')
-        
-        logger.info(f"Gender distribution: {dict(df['Gender'].value_counts())}")
-        return df
-    
-    def _clean_departments(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Expand and standardize department names."""
-        logger.info("Standardizing department names...")
-        
-        df['Department'] = df['Department'].replace(self.department_mapping)
-        df['Department'] = df['Department'].fillna('Undeclared').astype('string')
-        
-        logger.info(f"Departments processed: {df['Department'].nunique()} unique departments")
-        return df
-    
-    def _clean_gpa(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Convert and validate GPA data."""
-        logger.info("Processing GPA data...")
-        original_count = len(df)
-        
-        df['GPA'] = df['GPA'].replace(self.grade_mapping)
-        df['GPA'] = pd.to_numeric(df['GPA'], errors='coerce')
-        
-        # Impute missing values
-        missing_count = df['GPA'].isna().sum()
-        df['GPA'] = df['GPA'].fillna(df['GPA'].interpolate(method='linear'))
-        df['GPA'] = df['GPA'].round(2)
-        
-        # Remove outliers
-        df = df[df['GPA'] >= 1.0]
-        
-        removed_count = original_count - len(df)
-        logger.info(f"GPA processing: {missing_count} values imputed, {removed_count} outliers removed")
-        return df
-    
-    def _clean_satisfaction(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Validate satisfaction scores."""
-        logger.info("Processing satisfaction scores...")
-        original_count = len(df)
-        
-        missing_count = df['Satisfaction (1-5)'].isna().sum()
-        df['Satisfaction (1-5)'] = df['Satisfaction (1-5)'].fillna(
-            df['Satisfaction (1-5)'].interpolate(method='linear')
+    @staticmethod
+    def _remap_categories(series: pd.Series, mapping: Dict[str, str], default: str) -> pd.Series:
+        """
+        Standardize a categorical column by rewriting its categories index.
+
+        Renaming touches only the handful of category labels, not the rows.
+        When several raw spellings collapse into one canonical name (so the
+        renamed index would not be unique) the codes are re-pointed through a
+        factorized lookup, which is still a single int8 gather per row.
+        """
+        new_categories = pd.Index([mapping.get(c, c) for c in series.cat.categories])
+        if new_categories.is_unique:
+            result = series.cat.rename_categories(new_categories)
+        else:
+            lookup, unique = pd.factorize(new_categories)
+            codes = series.cat.codes.to_numpy()
+            merged = np.where(codes >= 0, lookup[codes], -1)
+            result = pd.Series(
+                pd.Categorical.from_codes(merged, categories=unique),
+                index=series.index,
+            )
+        if default not in result.cat.categories:
+            result = result.cat.add_categories([default])
+        return result.fillna(default)
+
+    @staticmethod
+    def _interpolate_missing(values: np.ndarray) -> np.ndarray:
+        """Fill NaNs in-place by linear interpolation over the positional index."""
+        missing = np.isnan(values)
+        if missing.any() and not missing.all():
+            positions = np.arange(values.size)
+            values[missing] = np.interp(
+                positions[missing], positions[~missing], values[~missing]
+            )
+            # Match Series.interpolate: values before the first observation stay missing
+            values[:np.flatnonzero(~missing)[0]] = np.nan
+        return values
+
+    def _load_dataframe(self, input_path: str) -> pd.DataFrame:
+        """
+        Read the raw CSV with PyArrow's multithreaded parser.
+
+        Column types are resolved inside the Arrow reader, so the frame
+        arrives with categoricals and Arrow-backed strings in one pass. The
+        dirty columns (Timestamp, Age, GPA) are read as strings and coerced
+        in _clean_dataframe, so arbitrary garbage tokens become NaN there
+        instead of failing inside the reader.
+        """
+        table = pv.read_csv(
+            input_path,
+            read_options=pv.ReadOptions(use_threads=True),
+            convert_options=pv.ConvertOptions(
+                column_types={
+                    'Timestamp': pa.string(),
+                    'Student ID': pa.string(),
+                    'Age': pa.string(),
+                    'Gender': pa.dictionary(pa.int32(), pa.string()),
+                    'Department': pa.dictionary(pa.int32(), pa.string()),
+                    'GPA': pa.string(),
+                    'Satisfaction (1-5)': pa.float32(),
+                    'Comments': pa.string(),
+                },
+                strings_can_be_null=True,
+            ),
         )
-        df['Satisfaction (1-5)'] = df['Satisfaction (1-5)'].round(2)
-        df = df[df['Satisfaction (1-5)'] >= 1.0]
-        
-        removed_count = original_count - len(df)
-        logger.info(f"Satisfaction processing: {missing_count} values imputed, {removed_count} outliers removed")
+        # Dictionary columns become pandas categoricals; plain string columns
+        # stay Arrow-backed
+        return table.to_pandas(types_mapper={pa.string(): ARROW_STRING}.get)
+
+    def _clean_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply all column transforms and row filters in one traversal.
+
+        Every column transform is computed up front as a plain array, row
+        validity is combined into a single boolean mask, and the frame is
+        filtered exactly once instead of once per cleaning step. Imputation
+        runs over the surviving rows only, so the interpolated values match
+        the old step-by-step pipeline.
+        """
+        total_count = len(df)
+
+        # Column transforms (pure, no row drops yet)
+        # Arrow kernels lowercase and trim the contiguous UTF-8 buffers
+        # directly, with no per-string Python allocations
+        ids = pa.array(df['Student ID'], type=pa.string())
+        student_ids = pd.array(pc.utf8_trim_whitespace(pc.utf8_lower(ids)), dtype=ARROW_STRING)
+
+        # Coerce the dirty columns: any unparseable token becomes NaN/NaT
+        # and is dropped by the validity mask below
+        timestamps = pd.to_datetime(df['Timestamp'], format=TIMESTAMP_FORMAT, errors='coerce')
+        ages = pd.to_numeric(df['Age'], errors='coerce').to_numpy(dtype=np.float32, na_value=np.nan)
+
+        gender_map = {c: str(self.gender_mapping.get(c, c)).title() for c in df['Gender'].cat.categories}
+        genders = self._remap_categories(df['Gender'], gender_map, 'Other')
+        departments = self._remap_categories(df['Department'], self.department_mapping, 'Undeclared')
+
+        # Hash-lookup for letter grades, numeric parse for everything else
+        gpa = df['GPA'].map(self.grade_mapping).combine_first(
+            pd.to_numeric(df['GPA'], errors='coerce')
+        ).to_numpy(dtype=np.float64, na_value=np.nan)
+
+        scores = df['Satisfaction (1-5)'].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # Row-validity masks; NaN compares False, so the range checks also
+        # drop missing values
+        timestamp_ok = timestamps.notna().to_numpy()
+        keep = timestamp_ok & (ages >= 18) & (ages <= 60)
+        after_age_count = int(keep.sum())
+        logger.info("Timestamp cleaning: %d invalid records removed", total_count - int(timestamp_ok.sum()))
+        logger.info("Age validation: %d records removed (invalid/out-of-range)", int(timestamp_ok.sum()) - after_age_count)
+
+        gpa = gpa[keep]
+        gpa_missing = int(np.isnan(gpa).sum())
+        # Values stay full precision in memory; rounding happens once at
+        # export time via float_format
+        gpa = self._interpolate_missing(gpa)
+        gpa_ok = gpa >= 1.0
+        gpa = gpa[gpa_ok]
+        keep[keep] = gpa_ok
+        after_gpa_count = int(keep.sum())
+        logger.info("GPA processing: %d values imputed, %d outliers removed", gpa_missing, after_age_count - after_gpa_count)
+
+        scores = scores[keep]
+        scores_missing = int(np.isnan(scores).sum())
+        scores = self._interpolate_missing(scores)
+        scores_ok = scores >= 1.0
+        scores = scores[scores_ok]
+        gpa = gpa[scores_ok]
+        keep[keep] = scores_ok
+        logger.info("Satisfaction processing: %d values imputed, %d outliers removed", scores_missing, after_gpa_count - int(keep.sum()))
+
+        # Build the cleaned frame once from the precomputed arrays - no
+        # in-place mutations or per-column reassignments that would force
+        # repeated BlockManager consolidations
+        df = pd.DataFrame({
+            'Timestamp': timestamps.to_numpy()[keep],
+            'Student_ID': student_ids[keep],
+            'Age': ages[keep].astype(np.int8),
+            'Gender': genders.array[keep],
+            'Department': departments.array[keep],
+            'GPA': gpa,
+            'Satisfaction (1-5)': scores,
+            'Comments': df['Comments'].array[keep],
+        })
+
+        # Guard the full-column aggregations so they never run when INFO
+        # logging is disabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Student IDs processed: %d unique IDs", df['Student_ID'].nunique())
+            logger.info("Gender distribution: %s", df['Gender'].value_counts().to_dict())
+            logger.info("Departments processed: %d unique departments", df['Department'].nunique())
         return df
-    
-    def _standardize_comment(self, idx: int, text: str) -> str:
-        """Standardize individual comment format."""
-        if isinstance(text, str) and text.startswith('This is spam'):
-            return f'Comment {idx}: The course was great!'
-        elif isinstance(text, str) and text.startswith('Comment'):
-            parts = text.split(':', 1)
-            content = parts[1].strip() if len(parts) > 1 else 'No comment'
-            return f'Comment {idx}: {content}'
-        elif isinstance(text, str) and text.strip():
-            return f'Comment {idx}: {text.strip()}'
-        else:
-            return f'Comment {idx}: No comment'
-    
-    def _clean_comments(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Standardize comment format and handle spam."""
+
+    def _clean_comments(self, df: pd.DataFrame, offset: int = 0) -> pd.DataFrame:
+        """Standardize comment format and handle spam.
+
+        Args:
+            df: Frame to process
+            offset: Starting comment number, used by the chunked reader to
+                keep numbering continuous across chunks
+        """
         logger.info("Standardizing comments...")
-        
-        df['Comments'] = df['Comments'].fillna("The course was great!")
-        df = df.sort_values('Timestamp', ascending=True).reset_index(drop=True)
-        
-        df['Comments'] = [
-            self._standardize_comment(i, txt) 
-            for i, txt in enumerate(df['Comments'])
-        ]
-        df['Comments'] = df['Comments'].astype('string')
-        
-        logger.info(f"Comments standardized: {len(df)} comments processed")
+
+        # Stable int64 argsort instead of a full-frame sort_values; skipped
+        # entirely when the export already arrives in order
+        timestamps = df['Timestamp'].to_numpy().view('i8')
+        if not (np.diff(timestamps) >= 0).all():
+            df = df.take(np.argsort(timestamps, kind='stable'), axis=0)
+        df = df.reset_index(drop=True)
+
+        comments = df['Comments'].astype(ARROW_STRING).fillna("The course was great!")
+        is_spam = comments.str.startswith('This is spam', na=False)
+        is_prefixed = comments.str.startswith('Comment', na=False)
+
+        # Extract the content portion of each comment without per-row Python calls
+        content = comments.str.strip()
+        after_colon = comments.str.extract(r'(?s)^[^:]*:(?P<content>.*)', expand=False).str.strip()
+        content = content.where(~is_prefixed, after_colon)
+        content = content.mask(content.isna() | (content == ''), 'No comment')
+        content = content.mask(is_spam, 'The course was great!')
+
+        # Format the row numbers in one NumPy C loop and assemble the final
+        # strings with a single Arrow join kernel instead of per-row f-strings
+        positions = pa.array(np.arange(offset, offset + len(df)).astype(str))
+        joined = pc.binary_join_element_wise('Comment ', positions, ': ', pa.array(content), '')
+        df['Comments'] = pd.array(joined, dtype=ARROW_STRING)
+
+        logger.info("Comments standardized: %d comments processed", len(df))
         return df
     
-    def clean_dataset(self, input_path: str, output_csv: str, output_excel: str) -> pd.DataFrame:
+    def _clean_dataset_polars(self, input_path: str) -> pd.DataFrame:
+        """
+        Run the full cleaning pipeline as a single Polars lazy query.
+
+        All column transforms and row filters are fused into one query plan,
+        so the CSV is parsed by Polars' multithreaded reader and the data is
+        materialized once instead of once per cleaning step.
+        """
+        logger.info("Running cleaning pipeline on the Polars engine...")
+
+        comments = pl.col('Comments').fill_null('The course was great!')
+        content = (
+            pl.when(comments.str.starts_with('This is spam'))
+            .then(pl.lit('The course was great!'))
+            .when(comments.str.starts_with('Comment'))
+            .then(comments.str.splitn(':', 2).struct.field('field_1').str.strip_chars())
+            .otherwise(comments.str.strip_chars())
+        )
+        content = (
+            pl.when(content.is_null() | (content == ''))
+            .then(pl.lit('No comment'))
+            .otherwise(content)
+        )
+
+        lazy = (
+            # Read the dirty columns as strings so cleaning does not depend
+            # on what Polars' schema inference saw in the first rows
+            pl.scan_csv(input_path, schema_overrides={
+                'Timestamp': pl.String, 'Age': pl.String, 'GPA': pl.String,
+            })
+            .with_columns(
+                pl.col('Timestamp').str.to_datetime(TIMESTAMP_FORMAT, strict=False),
+                pl.col('Student ID').str.to_lowercase().str.strip_chars().alias('Student_ID'),
+                pl.col('Age').cast(pl.Float64, strict=False),
+            )
+            .drop('Student ID')
+            .filter(pl.col('Timestamp').is_not_null())
+            .filter(pl.col('Age').is_between(18, 60))
+            .with_columns(
+                pl.col('Age').cast(pl.Int64),
+                pl.col('Gender')
+                .replace({k: v for k, v in self.gender_mapping.items() if isinstance(k, str)})
+                .fill_null('Other')
+                .str.to_titlecase(),
+                pl.col('Department')
+                .replace({k: v for k, v in self.department_mapping.items() if isinstance(k, str)})
+                .fill_null('Undeclared'),
+                pl.col('GPA')
+                .replace({k: str(v) for k, v in self.grade_mapping.items()})
+                .cast(pl.Float64, strict=False)
+                .interpolate()
+                .forward_fill(),
+            )
+            .filter(pl.col('GPA') >= 1.0)
+            .with_columns(
+                pl.col('Satisfaction (1-5)').cast(pl.Float64).interpolate().forward_fill()
+            )
+            .filter(pl.col('Satisfaction (1-5)') >= 1.0)
+            .sort('Timestamp', maintain_order=True)
+            .with_columns(
+                pl.format('Comment {}: {}', pl.int_range(pl.len()), content).alias('Comments')
+            )
+            .select([
+                'Timestamp', 'Student_ID', 'Age', 'Gender', 'Department',
+                'GPA', 'Satisfaction (1-5)', 'Comments',
+            ])
+        )
+
+        df = lazy.collect(engine='streaming').to_pandas()
+        df['Comments'] = df['Comments'].astype(ARROW_STRING)
+        df[['Gender', 'Department']] = df[['Gender', 'Department']].astype('category')
+
+        logger.info("Polars pipeline complete: %s records cleaned", f"{len(df):,}")
+        return df
+
+    def _clean_dataset_chunked(self, input_path: str, output_csv: str, chunksize: int) -> int:
+        """
+        Stream an arbitrarily large export through the cleaner in bounded memory.
+
+        Chunks are read with the pandas C parser, pushed through the fused
+        cleaner and appended to the output CSV one at a time, so peak memory
+        is proportional to the chunk size rather than the file. Interpolation
+        and sorting operate within each chunk, which assumes the export is
+        roughly timestamp-ordered (as Google Forms responses are).
+
+        Returns:
+            Total number of cleaned records written
+        """
+        logger.info("Streaming %s in chunks of %s rows", input_path, f"{chunksize:,}")
+
+        reader = pd.read_csv(
+            input_path,
+            chunksize=chunksize,
+            dtype={
+                'Timestamp': ARROW_STRING,
+                'Student ID': 'string',
+                'Gender': 'category',
+                'Department': 'category',
+                'Age': ARROW_STRING,
+                'GPA': 'object',
+                'Satisfaction (1-5)': 'Float32',
+                'Comments': ARROW_STRING,
+            },
+        )
+
+        total_count = 0
+        for chunk in reader:
+            cleaned = self._clean_comments(self._clean_dataframe(chunk), offset=total_count)
+            cleaned = cleaned.astype({'Age': 'int8', 'GPA': 'float32', 'Satisfaction (1-5)': 'float32'})
+            cleaned.to_csv(output_csv, mode='w' if total_count == 0 else 'a',
+                           header=total_count == 0, index=False, float_format='%.2f')
+            total_count += len(cleaned)
+
+        logger.info("Chunked cleaning complete: %s records written to %s", f"{total_count:,}", output_csv)
+        return total_count
+
+    def clean_dataset(self, input_path: str, output_csv: str, output_excel: str,
+                      write_excel: bool = True, chunksize: Optional[int] = None) -> Optional[pd.DataFrame]:
         """
         Execute the complete data cleaning pipeline.
-        
+
         Args:
             input_path: Path to the raw CSV file
-            output_csv: Path for cleaned CSV output
+            output_csv: Path for cleaned CSV output (a Parquet copy is written
+                alongside it with the same stem)
             output_excel: Path for cleaned Excel output
-            
+            write_excel: Set False to skip the Excel workbook, which is by far
+                the slowest output format
+            chunksize: Process the input in streams of this many rows for
+                files larger than RAM; only the CSV output is written and
+                None is returned
+
         Returns:
-            Cleaned pandas DataFrame
+            Cleaned pandas DataFrame, or None when chunksize is given.
+            Numeric columns are downcast (Age to int8, GPA and satisfaction
+            to float32) to keep the frame small.
         """
         try:
-            logger.info(f"Starting data cleaning pipeline for: {input_path}")
-            
-            # Load data
-            df = pd.read_csv(input_path)
-            logger.info(f"Dataset loaded: {len(df):,} records, {len(df.columns)} columns")
-            
-            # Apply cleaning pipeline
-            df = self._clean_timestamps(df)
-            df = self._clean_student_ids(df)
-            df = self._clean_ages(df)
-            df = self._clean_gender(df)
-            df = self._clean_departments(df)
-            df = self._clean_gpa(df)
-            df = self._clean_satisfaction(df)
-            df = self._clean_comments(df)
+            logger.info("Starting data cleaning pipeline for: %s", input_path)
+
+            if chunksize is not None:
+                os.makedirs(os.path.dirname(output_csv), exist_ok=True)
+                self._clean_dataset_chunked(input_path, output_csv, chunksize)
+                return None
+
+            if pl is not None:
+                # Fast path: one fused lazy query on the Polars engine
+                df = self._clean_dataset_polars(input_path)
+            else:
+                # Fallback: Arrow CSV reader plus the fused pandas cleaner
+                df = self._load_dataframe(input_path)
+                logger.info("Dataset loaded: %s records, %d columns", f"{len(df):,}", len(df.columns))
+
+                df = self._clean_dataframe(df)
+                df = self._clean_comments(df)
             
+            # None of the numeric columns needs 64-bit width: Age fits int8
+            # and the two rounded scores fit float32, halving their memory
+            # footprint for downstream consumers
+            df = df.astype({'Age': 'int8', 'GPA': 'float32', 'Satisfaction (1-5)': 'float32'})
+
             # Create output directory if it doesn't exist
             os.makedirs(os.path.dirname(output_csv), exist_ok=True)
             
-            # Export cleaned data
-            df.to_csv(output_csv, index=False)
-            df.to_excel(output_excel, index=False, sheet_name='Cleaned Student Data')
-            
-            # Log final statistics
-            logger.info("="*60)
-            logger.info("DATA CLEANING PIPELINE COMPLETE")
-            logger.info("="*60)
-            logger.info(f"Final dataset: {len(df):,} records")
-            logger.info(f"Date range: {df['Timestamp'].min().date()} to {df['Timestamp'].max().date()}")
-            logger.info(f"Age range: {df['Age'].min()}-{df['Age'].max()} years")
-            logger.info(f"Average GPA: {df['GPA'].mean():.2f}")
-            logger.info(f"Average satisfaction: {df['Satisfaction (1-5)'].mean():.2f}")
-            logger.info(f"Files saved: {output_csv}, {output_excel}")
+            # Export cleaned data; Parquet is the primary analytical output
+            output_parquet = os.path.splitext(output_csv)[0] + '.parquet'
+
+            def write_excel_output() -> None:
+                # xlsxwriter streams to disk instead of building openpyxl's
+                # in-memory DOM; constant_memory mode would go further but
+                # flushes rows eagerly, which discards the column-by-column
+                # writes to_excel performs
+                with pd.ExcelWriter(output_excel, engine='xlsxwriter') as writer:
+                    df.to_excel(writer, index=False, sheet_name='Cleaned Student Data',
+                                float_format='%.2f')
+
+            # The writers are independent and release the GIL in their C
+            # cores, so running them in threads costs max() instead of sum()
+            writers = [
+                lambda: df.to_csv(output_csv, index=False, float_format='%.2f'),
+                lambda: df.to_parquet(output_parquet, compression='zstd'),
+            ]
+            if write_excel:
+                writers.append(write_excel_output)
+            with ThreadPoolExecutor(max_workers=len(writers)) as executor:
+                for future in [executor.submit(w) for w in writers]:
+                    future.result()
+
+            # Log final statistics; the column aggregations only run when
+            # INFO logging is enabled
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("=" * 60)
+                logger.info("DATA CLEANING PIPELINE COMPLETE")
+                logger.info("=" * 60)
+                logger.info("Final dataset: %s records", f"{len(df):,}")
+                logger.info("Date range: %s to %s", df['Timestamp'].min().date(), df['Timestamp'].max().date())
+                logger.info("Age range: %d-%d years", df['Age'].min(), df['Age'].max())
+                logger.info("Average GPA: %.2f", df['GPA'].mean())
+                logger.info("Average satisfaction: %.2f", df['Satisfaction (1-5)'].mean())
+                saved = [output_csv, output_parquet] + ([output_excel] if write_excel else [])
+                logger.info("Files saved: %s", ', '.join(saved))
             
             return df
             
         except Exception as e:
-            logger.error(f"Error in data cleaning pipeline: {str(e)}")
+            logger.error("Error in data cleaning pipeline: %s", e)
             raise
 
 
-def clean_student_data(input_csv: str, output_csv: str, output_excel: str) -> pd.DataFrame:
+def clean_student_data(input_csv: str, output_csv: str, output_excel: str,
+                       write_excel: bool = True,
+                       chunksize: Optional[int] = None) -> Optional[pd.DataFrame]:
     """
     Main function to clean student survey data.
-    
+
     Args:
         input_csv: Path to raw CSV file
-        output_csv: Path for cleaned CSV output  
+        output_csv: Path for cleaned CSV output
         output_excel: Path for cleaned Excel output
-        
+        write_excel: Set False to skip the Excel workbook for faster batch runs
+        chunksize: Stream inputs larger than RAM in chunks of this many rows
+
     Returns:
-        Cleaned pandas DataFrame
+        Cleaned pandas DataFrame, or None when streaming with chunksize
     """
     cleaner = StudentDataCleaner()
-    return cleaner.clean_dataset(input_csv, output_csv, output_excel)
+    return cleaner.clean_dataset(input_csv, output_csv, output_excel,
+                                 write_excel=write_excel, chunksize=chunksize)
 
 if __name__ == "__main__":
     # Define file paths